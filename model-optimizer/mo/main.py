@@ -15,58 +15,88 @@
 """
 
 import argparse
-import datetime
+import functools
+import importlib
 import logging as log
 import os
 import sys
+import time
 import traceback
 from collections import OrderedDict
 
-import numpy as np
+try:
+    import resource
+except ImportError:
+    # the module is not available on Windows
+    resource = None
 
-from extensions.back.SpecialNodesFinalization import RemoveConstOps, CreateConstNodesReplacement, RemoveOutputOps, \
-    NormalizeTI
 from mo.utils.get_ov_update_message import get_ov_update_message
-from mo.graph.graph import Graph
-from mo.middle.pattern_match import for_graph_and_each_sub_graph_recursively, for_each_sub_graph_recursively
-from mo.pipeline.common import prepare_emit_ir, get_ir_version
-from mo.pipeline.unified import unified_pipeline
-from mo.utils import import_extensions
 from mo.utils.cli_parser import get_placeholder_shapes, get_tuple_values, get_model_name, \
     get_common_cli_options, get_caffe_cli_options, get_tf_cli_options, get_mxnet_cli_options, get_kaldi_cli_options, \
     get_onnx_cli_options, get_mean_scale_dictionary, parse_tuple_pairs, get_freeze_placeholder_values, \
-    append_exp_keys_to_namespace, get_meta_info
+    append_exp_keys_to_namespace, get_meta_info, get_all_cli_parser, get_framework_cli_parser
 from mo.utils.error import Error, FrameworkError
-from mo.utils.guess_framework import deduce_framework_by_namespace
+from mo.utils.guess_framework import deduce_framework_name
 from mo.utils.logger import init_logger
-from mo.utils.model_analysis import AnalysisResults
 from mo.utils.utils import refer_to_faq_msg
 from mo.utils.version import get_version
 from mo.utils.versions_checker import check_requirements
 
+# ru_maxrss is reported in bytes on macOS and in kilobytes on other platforms
+maxrss_units_per_kilobyte = 1024 if sys.platform == 'darwin' else 1
+
+register_custom_ops_modules = {
+    'tf': 'mo.front.tf.register_custom_ops',
+    'caffe': 'mo.front.caffe.register_custom_ops',
+    'mxnet': 'mo.front.mxnet.register_custom_ops',
+    'kaldi': 'mo.front.kaldi.register_custom_ops',
+    'onnx': 'mo.front.onnx.register_custom_ops',
+}
+
+
+def _sniff_framework(argv_list: list):
+    """
+    Deduces the framework from the --framework option or from the name of the launched script (mo_tf.py -> tf)
+    without building the full argument parser. Returns None if the framework cannot be deduced.
+    """
+    frameworks = ['tf', 'caffe', 'mxnet', 'kaldi', 'onnx']
+    args = argv_list[1:]
+    for i, arg in enumerate(args):
+        if arg.startswith('--framework='):
+            value = arg.split('=', 1)[1]
+            return value if value in frameworks else None
+        if arg == '--framework':
+            return args[i + 1] if i + 1 < len(args) and args[i + 1] in frameworks else None
+
+    script_name = os.path.splitext(os.path.basename(argv_list[0]))[0] if argv_list else ''
+    if script_name.startswith('mo_') and script_name[len('mo_'):] in frameworks:
+        return script_name[len('mo_'):]
+    return None
+
 
 def replace_ext(name: str, old: str, new: str):
+    """
+    Replaces extension 'old' of the file name with 'new'. Returns None if the file name has another extension.
+    """
     base, ext = os.path.splitext(name)
-    log.debug("base: {}, ext: {}".format(base, ext))
+    log.debug("base: %s, ext: %s", base, ext)
     if ext == old:
         return base + new
+    return None
 
 
-def print_argv(argv: argparse.Namespace, is_caffe: bool, is_tf: bool, is_mxnet: bool, is_kaldi: bool, is_onnx: bool,
-               model_name: str):
+def print_argv(argv: argparse.Namespace, framework: str, model_name: str):
     print('Model Optimizer arguments:')
+    framework_cli_options = {
+        'caffe': get_caffe_cli_options,
+        'tf': get_tf_cli_options,
+        'mxnet': get_mxnet_cli_options,
+        'kaldi': get_kaldi_cli_options,
+        'onnx': get_onnx_cli_options,
+    }
     props = OrderedDict()
     props['common_args'] = get_common_cli_options(model_name)
-    if is_caffe:
-        props['caffe_args'] = get_caffe_cli_options()
-    if is_tf:
-        props['tf_args'] = get_tf_cli_options()
-    if is_mxnet:
-        props['mxnet_args'] = get_mxnet_cli_options()
-    if is_kaldi:
-        props['kaldi_args'] = get_kaldi_cli_options()
-    if is_onnx:
-        props['onnx_args'] = get_onnx_cli_options()
+    props['{}_args'.format(framework)] = framework_cli_options[framework]()
 
     framework_specifics_map = {
         'common_args': 'Common parameters:',
@@ -77,46 +107,49 @@ def print_argv(argv: argparse.Namespace, is_caffe: bool, is_tf: bool, is_mxnet:
         'onnx_args': 'ONNX specific parameters:',
     }
 
+    argv_dict = vars(argv)
+    default_custom_layers_mapping = os.path.join(os.path.dirname(sys.argv[0]),
+                                                 'extensions/front/caffe/CustomLayersMapping.xml')
     lines = []
     for key in props:
         lines.append(framework_specifics_map[key])
         for (op, desc) in props[key].items():
             if isinstance(desc, list):
-                lines.append('\t{}: \t{}'.format(desc[0], desc[1](getattr(argv, op, 'NONE'))))
+                lines.append('\t{}: \t{}'.format(desc[0], desc[1](argv_dict.get(op, 'NONE'))))
+            elif op == 'k' and argv_dict.get(op, 'NONE') == default_custom_layers_mapping:
+                lines.append('\t{}: \t{}'.format(desc, 'Default'))
             else:
-                if op is 'k':
-                    default_path = os.path.join(os.path.dirname(sys.argv[0]),
-                                                'extensions/front/caffe/CustomLayersMapping.xml')
-                    if getattr(argv, op, 'NONE') == default_path:
-                        lines.append('\t{}: \t{}'.format(desc, 'Default'))
-                        continue
-                lines.append('\t{}: \t{}'.format(desc, getattr(argv, op, 'NONE')))
+                lines.append('\t{}: \t{}'.format(desc, argv_dict.get(op, 'NONE')))
     lines.append('Model Optimizer version: \t{}'.format(get_version()))
     print('\n'.join(lines))
 
 
 def prepare_ir(argv: argparse.Namespace):
-    is_tf, is_caffe, is_mxnet, is_kaldi, is_onnx = deduce_framework_by_namespace(argv)
+    # heavy graph/pipeline modules are imported here to keep 'mo.py --help' fast
+    from mo.pipeline.unified import unified_pipeline
+    from mo.utils import import_extensions
 
-    if not any([is_tf, is_caffe, is_mxnet, is_kaldi, is_onnx]):
+    framework = deduce_framework_name(argv)
+
+    if framework is None:
         raise Error('Framework {} is not a valid target. Please use --framework with one from the list: caffe, tf, '
                     'mxnet, kaldi, onnx. ' + refer_to_faq_msg(15), argv.framework)
 
-    if is_tf and not argv.input_model and not argv.saved_model_dir and not argv.input_meta_graph:
+    if framework == 'tf' and not argv.input_model and not argv.saved_model_dir and not argv.input_meta_graph:
         raise Error('Path to input model or saved model dir is required: use --input_model, --saved_model_dir or '
                     '--input_meta_graph')
-    elif is_mxnet and not argv.input_model and not argv.input_symbol and not argv.pretrained_model_name:
+    elif framework == 'mxnet' and not argv.input_model and not argv.input_symbol and not argv.pretrained_model_name:
         raise Error('Path to input model or input symbol or pretrained_model_name is required: use --input_model or '
                     '--input_symbol or --pretrained_model_name')
-    elif is_caffe and not argv.input_model and not argv.input_proto:
+    elif framework == 'caffe' and not argv.input_model and not argv.input_proto:
         raise Error('Path to input model or input proto is required: use --input_model or --input_proto')
-    elif (is_kaldi or is_onnx) and not argv.input_model:
+    elif framework in ['kaldi', 'onnx'] and not argv.input_model:
         raise Error('Path to input model is required: use --input_model.')
 
-    if is_kaldi:
+    if framework == 'kaldi':
         argv.generate_experimental_IR_V10 = False
 
-    log.debug(str(argv))
+    log.debug('%s', argv)
     log.debug("Model Optimizer started")
 
     model_name = "<UNKNOWN_NAME>"
@@ -124,19 +157,19 @@ def prepare_ir(argv: argparse.Namespace):
         model_name = argv.model_name
     elif argv.input_model:
         model_name = get_model_name(argv.input_model)
-    elif is_tf and argv.saved_model_dir:
+    elif framework == 'tf' and argv.saved_model_dir:
         model_name = "saved_model"
-    elif is_tf and argv.input_meta_graph:
+    elif framework == 'tf' and argv.input_meta_graph:
         model_name = get_model_name(argv.input_meta_graph)
-    elif is_mxnet and argv.input_symbol:
+    elif framework == 'mxnet' and argv.input_symbol:
         model_name = get_model_name(argv.input_symbol)
     argv.model_name = model_name
 
-    log.debug('Output model name would be {}{{.xml, .bin}}'.format(argv.model_name))
+    log.debug('Output model name would be %s{.xml, .bin}', argv.model_name)
 
     # if --input_proto is not provided, try to retrieve another one
     # by suffix substitution from model file name
-    if is_caffe and not argv.input_proto:
+    if framework == 'caffe' and not argv.input_proto:
         argv.input_proto = replace_ext(argv.input_model, '.caffemodel', '.prototxt')
 
         if not argv.input_proto:
@@ -144,27 +177,29 @@ def prepare_ir(argv: argparse.Namespace):
                         "protobuf file that stores topology and --input_model that stores " +
                         "pretrained weights. " +
                         refer_to_faq_msg(20))
-        log.info('Deduced name for prototxt: {}'.format(argv.input_proto))
+        log.info('Deduced name for prototxt: %s', argv.input_proto)
 
-    if not argv.silent:
-        print_argv(argv, is_caffe, is_tf, is_mxnet, is_kaldi, is_onnx, argv.model_name)
+    # arguments are printed for interactive runs only unless --verbose_print is specified
+    if not argv.silent and (sys.stdout.isatty() or getattr(argv, 'verbose_print', False)):
+        print_argv(argv, framework, argv.model_name)
 
-    ret_code = check_requirements(framework=argv.framework)
+    ret_code = check_requirements(framework=argv.framework, use_cache=True)
     if ret_code:
         raise Error('check_requirements exit with return code {}'.format(ret_code))
 
-    if is_tf and argv.tensorflow_use_custom_operations_config is not None:
+    if framework == 'tf' and argv.tensorflow_use_custom_operations_config is not None:
         argv.transformations_config = argv.tensorflow_use_custom_operations_config
 
     mean_file_offsets = None
-    if is_caffe and argv.mean_file and argv.mean_values:
+    if framework == 'caffe' and argv.mean_file and argv.mean_values:
         raise Error('Both --mean_file and mean_values are specified. Specify either mean file or mean values. ' +
                     refer_to_faq_msg(17))
-    elif is_caffe and argv.mean_file and argv.mean_file_offsets:
+    elif framework == 'caffe' and argv.mean_file and argv.mean_file_offsets:
+        import numpy as np
 
         values = get_tuple_values(argv.mean_file_offsets, t=int, num_exp_values=2)
-        mean_file_offsets = np.array([int(x) for x in values[0].split(',')])
-        if not all([offset >= 0 for offset in mean_file_offsets]):
+        mean_file_offsets = np.array(values[0].split(','), dtype=np.int64)
+        if (mean_file_offsets < 0).any():
             raise Error("Negative value specified for --mean_file_offsets option. "
                         "Please specify positive integer values in format '(x,y)'. " +
                         refer_to_faq_msg(18))
@@ -179,10 +214,10 @@ def prepare_ir(argv: argparse.Namespace):
         log.error("The scale value is less than 1.0. This is most probably an issue because the scale value specifies "
                   "floating point value which all input values will be *divided*.", extra={'is_warning': True})
 
-    if argv.input_model and (is_tf and argv.saved_model_dir):
+    if argv.input_model and (framework == 'tf' and argv.saved_model_dir):
         raise Error('Both --input_model and --saved_model_dir are defined. '
                     'Specify either input model or saved model directory.')
-    if is_tf:
+    if framework == 'tf':
         if argv.saved_model_tags is not None:
             if ' ' in argv.saved_model_tags:
                 raise Error('Incorrect saved model tag was provided. Specify --saved_model_tags with no spaces in it')
@@ -198,19 +233,17 @@ def prepare_ir(argv: argparse.Namespace):
     mean_scale = get_mean_scale_dictionary(mean_values, scale_values, argv.input)
     argv.mean_scale_values = mean_scale
 
-    if not os.path.exists(argv.output_dir):
-        try:
-            os.makedirs(argv.output_dir)
-        except PermissionError as e:
-            raise Error("Failed to create directory {}. Permission denied! " +
-                        refer_to_faq_msg(22),
-                        argv.output_dir) from e
-    else:
-        if not os.access(argv.output_dir, os.W_OK):
-            raise Error("Output directory {} is not writable for current user. " +
-                        refer_to_faq_msg(22), argv.output_dir)
+    try:
+        os.makedirs(argv.output_dir, exist_ok=True)
+    except PermissionError as e:
+        raise Error("Failed to create directory {}. Permission denied! " +
+                    refer_to_faq_msg(22),
+                    argv.output_dir) from e
+    if not os.access(argv.output_dir, os.W_OK):
+        raise Error("Output directory {} is not writable for current user. " +
+                    refer_to_faq_msg(22), argv.output_dir)
 
-    log.debug("Placeholder shapes : {}".format(argv.placeholder_shapes))
+    log.debug("Placeholder shapes : %s", argv.placeholder_shapes)
 
     ret_res = 1
     if hasattr(argv, 'extensions') and argv.extensions and argv.extensions != '':
@@ -220,40 +253,50 @@ def prepare_ir(argv: argparse.Namespace):
 
     argv.freeze_placeholder_with_value, argv.input = get_freeze_placeholder_values(argv.input,
                                                                                    argv.freeze_placeholder_with_value)
-    if is_tf:
-        from mo.front.tf.register_custom_ops import get_front_classes
-        import_extensions.load_dirs(argv.framework, extensions, get_front_classes)
-    elif is_caffe:
-        from mo.front.caffe.register_custom_ops import get_front_classes
-        import_extensions.load_dirs(argv.framework, extensions, get_front_classes)
-    elif is_mxnet:
-        from mo.front.mxnet.register_custom_ops import get_front_classes
-        import_extensions.load_dirs(argv.framework, extensions, get_front_classes)
-    elif is_kaldi:
-        from mo.front.kaldi.register_custom_ops import get_front_classes
-        import_extensions.load_dirs(argv.framework, extensions, get_front_classes)
-    elif is_onnx:
-        from mo.front.onnx.register_custom_ops import get_front_classes
-        import_extensions.load_dirs(argv.framework, extensions, get_front_classes)
+    register_custom_ops = importlib.import_module(register_custom_ops_modules[framework])
+    import_extensions.load_dirs(argv.framework, extensions, register_custom_ops.get_front_classes)
     graph = unified_pipeline(argv)
     return graph
 
 
-def emit_ir(graph: Graph, argv: argparse.Namespace):
-    NormalizeTI().find_and_replace_pattern(graph)
-    for_graph_and_each_sub_graph_recursively(graph, RemoveConstOps().find_and_replace_pattern)
-    for_graph_and_each_sub_graph_recursively(graph, CreateConstNodesReplacement().find_and_replace_pattern)
-    if not graph.graph['cmd_params'].generate_experimental_IR_V10:
-        for_each_sub_graph_recursively(graph, RemoveOutputOps().find_and_replace_pattern)
-    if not graph.graph['cmd_params'].generate_experimental_IR_V10:
-        for_graph_and_each_sub_graph_recursively(graph, RemoveOutputOps().find_and_replace_pattern)
+@functools.lru_cache(maxsize=None)
+def get_finalization_passes():
+    """
+    Returns instances of the IR finalization passes. The passes have no state, so the instances are shared between
+    emit_ir calls.
+    """
+    from extensions.back.SpecialNodesFinalization import RemoveConstOps, CreateConstNodesReplacement, \
+        RemoveOutputOps, NormalizeTI
+    return NormalizeTI(), RemoveConstOps(), CreateConstNodesReplacement(), RemoveOutputOps()
+
+
+def emit_ir(graph, argv: argparse.Namespace):
+    from mo.middle.pattern_match import for_graph_and_each_sub_graph_recursively
+    from mo.pipeline.common import prepare_emit_ir, get_ir_version
+
+    cmd_params = graph.graph['cmd_params']
+
+    normalize_ti, remove_const_ops, create_const_nodes, remove_output_ops = get_finalization_passes()
+    normalize_ti.find_and_replace_pattern(graph)
+
+    # the passes modify only the graph they are applied to, so all of them are applied
+    # during a single traversal of the graph and its sub-graphs
+    finalization_passes = [remove_const_ops, create_const_nodes]
+    if not cmd_params.generate_experimental_IR_V10:
+        finalization_passes.append(remove_output_ops)
+
+    def apply_finalization_passes(g):
+        for finalization_pass in finalization_passes:
+            finalization_pass.find_and_replace_pattern(g)
+
+    for_graph_and_each_sub_graph_recursively(graph, apply_finalization_passes)
 
     prepare_emit_ir(graph=graph,
-                    data_type=graph.graph['cmd_params'].data_type,
+                    data_type=cmd_params.data_type,
                     output_dir=argv.output_dir,
                     output_model_name=argv.model_name,
-                    mean_data=graph.graph['mf'] if 'mf' in graph.graph else None,
-                    input_names=graph.graph['input_names'] if 'input_names' in graph.graph else [],
+                    mean_data=graph.graph.get('mf'),
+                    input_names=graph.graph.get('input_names', []),
                     meta_info=get_meta_info(argv))
 
     if not (argv.framework == 'tf' and argv.tensorflow_custom_operations_config_update):
@@ -266,35 +309,43 @@ def emit_ir(graph: Graph, argv: argparse.Namespace):
 
 
 def driver(argv: argparse.Namespace):
-    init_logger(argv.log_level.upper(), argv.silent)
+    # the logger is already initialized with 'ERROR' level in main
+    if argv.log_level.upper() != 'ERROR' and not argv.silent:
+        init_logger(argv.log_level.upper(), argv.silent)
 
-    start_time = datetime.datetime.now()
+    start_time = time.perf_counter()
 
     ret_res = emit_ir(prepare_ir(argv), argv)
 
     if ret_res != 0:
         return ret_res
 
-    elapsed_time = datetime.datetime.now() - start_time
-    print('[ SUCCESS ] Total execution time: {:.2f} seconds. '.format(elapsed_time.total_seconds()))
+    elapsed_time = time.perf_counter() - start_time
+    print('[ SUCCESS ] Total execution time: {:.2f} seconds. '.format(elapsed_time))
 
-    try:
-        import resource
-        mem_usage = round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024)
-        if sys.platform == 'darwin':
-            mem_usage = round(mem_usage / 1024)
+    if resource is not None:
+        mem_usage = round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024 / maxrss_units_per_kilobyte)
         print('[ SUCCESS ] Memory consumed: {} MB. '.format(mem_usage))
-    except ImportError:
-        pass
 
     return ret_res
 
 
 def main(cli_parser: argparse.ArgumentParser, framework: str):
     try:
-        # Initialize logger with 'ERROR' as default level to be able to form nice messages
-        # before arg parser deliver log_level requested by user
-        init_logger('ERROR', False)
+        help_requested = any(arg in ('-h', '--help') for arg in sys.argv[1:])
+        if not help_requested:
+            # Initialize logger with 'ERROR' as default level to be able to form nice messages
+            # before arg parser deliver log_level requested by user
+            init_logger('ERROR', False)
+
+        if cli_parser is None:
+            # build only the options of the requested framework; the full parser is needed only when
+            # the framework is deduced from the input model later
+            framework = framework or _sniff_framework(sys.argv)
+            if framework or help_requested:
+                cli_parser = get_framework_cli_parser(framework)
+            else:
+                cli_parser = get_all_cli_parser()
 
         argv = cli_parser.parse_args()
         if framework:
@@ -303,6 +354,7 @@ def main(cli_parser: argparse.ArgumentParser, framework: str):
 
         # set output precision for operations producing bool values to be I32 as it was for the IRv7
         if argv.generate_deprecated_IR_V7:
+            import numpy as np
             from mo.middle.passes.convert_data_type import SUPPORTED_DATA_TYPES
             SUPPORTED_DATA_TYPES['bool'] = (np.bool, 'I32', 'boolean')
 
@@ -317,6 +369,7 @@ def main(cli_parser: argparse.ArgumentParser, framework: str):
         log.error('File {} was not found'.format(str(e).split('No such file or directory:')[1]))
         log.debug(traceback.format_exc())
     except Error as err:
+        from mo.utils.model_analysis import AnalysisResults
         analysis_results = AnalysisResults()
         if analysis_results.get_messages() is not None:
             for el in analysis_results.get_messages():
@@ -18,7 +18,7 @@ import argparse
 import unittest
 from unittest.mock import patch
 
-from mo.main import main
+from mo.main import main, _sniff_framework
 from mo.utils.error import FrameworkError
 
 
@@ -29,3 +29,20 @@ class TestMainErrors(unittest.TestCase):
         with self.assertLogs() as logger:
             main(argparse.ArgumentParser(), 'framework_string')
             self.assertEqual(logger.output, ['ERROR:root:FW ERROR MESSAGE'])
+
+
+class TestSniffFramework(unittest.TestCase):
+    def test_framework_option(self):
+        self.assertEqual(_sniff_framework(['mo.py', '--input_model', 'model.pb', '--framework', 'tf']), 'tf')
+
+    def test_framework_option_with_value(self):
+        self.assertEqual(_sniff_framework(['mo.py', '--framework=onnx']), 'onnx')
+
+    def test_framework_from_script_name(self):
+        self.assertEqual(_sniff_framework(['/opt/mo/mo_caffe.py', '--input_model', 'model.caffemodel']), 'caffe')
+
+    def test_unknown_framework(self):
+        self.assertIsNone(_sniff_framework(['mo.py', '--framework', 'unknown']))
+
+    def test_no_framework(self):
+        self.assertIsNone(_sniff_framework(['mo.py', '--input_model', 'model.pb']))
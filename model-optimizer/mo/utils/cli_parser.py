@@ -15,6 +15,7 @@
 """
 import argparse
 import ast
+import functools
 import logging as log
 import os
 import re
@@ -28,7 +29,7 @@ from mo.front.extractor import split_node_in_port
 from mo.middle.passes.convert_data_type import destination_type_to_np_data_type
 from mo.utils import import_extensions
 from mo.utils.error import Error
-from mo.utils.utils import refer_to_faq_msg
+from mo.utils.utils import refer_to_faq_msg, lru_cache_copy
 from mo.utils.version import get_version
 
 
@@ -306,6 +307,11 @@ def get_common_cli_parser(parser: argparse.ArgumentParser = None):
                                    'By default, log level is already ERROR. ',
                               action='store_true',
                               default=False)
+    common_group.add_argument('--verbose_print',
+                              help='Print Model Optimizer arguments even if the standard output is not a terminal, '
+                                   'for example, when it is redirected to a log file.',
+                              action='store_true',
+                              default=False)
     common_group.add_argument('--freeze_placeholder_with_value',
                               help='Replaces input layer with constant node with '
                                    'provided value, for example: "node_name->True". '
@@ -336,6 +342,7 @@ def get_common_cli_parser(parser: argparse.ArgumentParser = None):
     return parser
 
 
+@functools.lru_cache(maxsize=None)
 def get_common_cli_options(model_name):
     d = OrderedDict()
     d['input_model'] = '- Path to the Input Model'
@@ -357,6 +364,7 @@ def get_common_cli_options(model_name):
     return d
 
 
+@functools.lru_cache(maxsize=None)
 def get_caffe_cli_options():
     d = {
         'input_proto': ['- Path to the Input prototxt', lambda x: x],
@@ -370,6 +378,7 @@ def get_caffe_cli_options():
     return OrderedDict(sorted(d.items(), key=lambda t: t[0]))
 
 
+@functools.lru_cache(maxsize=None)
 def get_tf_cli_options():
     d = {
         'input_model_is_text': '- Input model in text protobuf format',
@@ -384,6 +393,7 @@ def get_tf_cli_options():
     return OrderedDict(sorted(d.items(), key=lambda t: t[0]))
 
 
+@functools.lru_cache(maxsize=None)
 def get_mxnet_cli_options():
     d = {
         'input_symbol': '- Deploy-ready symbol file',
@@ -397,6 +407,7 @@ def get_mxnet_cli_options():
     return OrderedDict(sorted(d.items(), key=lambda t: t[0]))
 
 
+@functools.lru_cache(maxsize=None)
 def get_kaldi_cli_options():
     d = {
         'counts': '- A file name with full path to the counts file',
@@ -407,6 +418,7 @@ def get_kaldi_cli_options():
     return OrderedDict(sorted(d.items(), key=lambda t: t[0]))
 
 
+@functools.lru_cache(maxsize=None)
 def get_onnx_cli_options():
     d = {
     }
@@ -641,6 +653,39 @@ def get_all_cli_parser():
     return parser
 
 
+def get_framework_cli_parser(framework: str = None):
+    """
+    Specifies cli arguments for Model Optimizer with the --framework option for a single framework only.
+    If the framework is not specified, only the framework-agnostic parameters are added.
+
+    Returns
+    -------
+        ArgumentParser instance
+    """
+    parser = argparse.ArgumentParser(usage='%(prog)s [options]',
+                                     epilog='Use --framework to display the framework-specific parameters.'
+                                     if framework is None else None)
+
+    parser.add_argument('--framework',
+                        help='Name of the framework used to train the input model.',
+                        type=str,
+                        choices=['tf', 'caffe', 'mxnet', 'kaldi', 'onnx'])
+
+    get_common_cli_parser(parser=parser)
+
+    framework_cli_parsers = {
+        'tf': get_tf_cli_parser,
+        'caffe': get_caffe_cli_parser,
+        'mxnet': get_mxnet_cli_parser,
+        'kaldi': get_kaldi_cli_parser,
+        'onnx': get_onnx_cli_parser,
+    }
+    if framework is not None:
+        framework_cli_parsers[framework](parser=parser)
+
+    return parser
+
+
 def append_exp_keys_to_namespace(argv: argparse.Namespace):
     setattr(argv, 'keep_quantize_ops_in_IR', True)
     setattr(argv, 'blobs_as_inputs', True)
@@ -757,6 +802,7 @@ def parse_input_value(input_value: str):
     return node_name, shape, value, data_type
 
 
+@lru_cache_copy(maxsize=64)
 def get_freeze_placeholder_values(argv_input: str, argv_freeze_placeholder_with_value: str):
     """
     Parses values for placeholder freezing and input node names
@@ -809,6 +855,7 @@ def get_freeze_placeholder_values(argv_input: str, argv_freeze_placeholder_with_
     return placeholder_values, input_node_names
 
 
+@lru_cache_copy(maxsize=64)
 def get_placeholder_shapes(argv_input: str, argv_input_shape: str, argv_batch=None):
     """
     Parses input layers names and input shapes from the cli and returns the parsed object.
@@ -898,6 +945,7 @@ def get_placeholder_shapes(argv_input: str, argv_input_shape: str, argv_batch=No
     return placeholder_shapes, placeholder_data_types
 
 
+@lru_cache_copy(maxsize=64)
 def parse_tuple_pairs(argv_values: str):
     """
     Gets mean/scale values from the given string parameter
@@ -961,6 +1009,7 @@ def parse_tuple_pairs(argv_values: str):
     return res
 
 
+@lru_cache_copy(maxsize=64)
 def get_tuple_values(argv_values: str or tuple, num_exp_values: int = 3, t=float or int):
     """
     Gets mean values from the given string parameter
@@ -21,7 +21,11 @@ from mo.utils.error import Error
 from mo.utils.utils import refer_to_faq_msg
 
 
-def deduce_framework_by_namespace(argv: Namespace):
+def deduce_framework_name(argv: Namespace):
+    """
+    Deduces the framework from the command line arguments if it is not specified explicitly and stores it in
+    argv.framework. Returns the framework name or None if the framework is not supported.
+    """
     if not argv.framework:
         if getattr(argv, 'saved_model_dir', None) or getattr(argv, 'input_meta_graph', None):
             argv.framework = 'tf'
@@ -37,7 +41,12 @@ def deduce_framework_by_namespace(argv: Namespace):
             raise Error('Framework name can not be deduced from the given options: {}={}. Use --framework to choose '
                         'one of caffe, tf, mxnet, kaldi, onnx', '--input_model', argv.input_model, refer_to_faq_msg(15))
 
-    return map(lambda x: argv.framework == x, ['tf', 'caffe', 'mxnet', 'kaldi', 'onnx'])
+    return argv.framework if argv.framework in ['tf', 'caffe', 'mxnet', 'kaldi', 'onnx'] else None
+
+
+def deduce_framework_by_namespace(argv: Namespace):
+    framework = deduce_framework_name(argv)
+    return map(lambda x: framework == x, ['tf', 'caffe', 'mxnet', 'kaldi', 'onnx'])
 
 
 def guess_framework_by_ext(input_model_path: str) -> int:
@@ -32,13 +32,13 @@ handler_num = 0
 
 class LvlFormatter(log.Formatter):
     format_dict = {
-        log.DEBUG: "[ %(asctime)s ] [ %(levelname)s ] [ %(module)s:%(lineno)d ]  %(msg)s",
-        log.INFO: "[ %(levelname)s ]  %(msg)s",
-        log.WARNING: "[ WARNING ]  %(msg)s",
-        log.ERROR: "[ %(levelname)s ]  %(msg)s",
-        log.CRITICAL: "[ %(levelname)s ]  %(msg)s",
-        'framework_error': "[ FRAMEWORK ERROR ]  %(msg)s",
-        'analysis_info': "[ ANALYSIS INFO ]  %(msg)s"
+        log.DEBUG: "[ %(asctime)s ] [ %(levelname)s ] [ %(module)s:%(lineno)d ]  %(message)s",
+        log.INFO: "[ %(levelname)s ]  %(message)s",
+        log.WARNING: "[ WARNING ]  %(message)s",
+        log.ERROR: "[ %(levelname)s ]  %(message)s",
+        log.CRITICAL: "[ %(levelname)s ]  %(message)s",
+        'framework_error': "[ FRAMEWORK ERROR ]  %(message)s",
+        'analysis_info': "[ ANALYSIS INFO ]  %(message)s"
     }
 
     def __init__(self, lvl, fmt=None):
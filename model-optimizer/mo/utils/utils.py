@@ -13,6 +13,7 @@
  See the License for the specific language governing permissions and
  limitations under the License.
 """
+import copy
 import functools
 import os
 import re
@@ -69,6 +70,25 @@ def deprecated_api(class_name=None, new_method_name=None):
     return deprecated
 
 
+def lru_cache_copy(maxsize: int = 128):
+    """
+    Memoizes function results similarly to functools.lru_cache but returns a deep copy of the cached result,
+    so the caller is free to modify the returned object. All function arguments must be hashable.
+    """
+    def decorator(func):
+        cached_func = functools.lru_cache(maxsize=maxsize)(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return copy.deepcopy(cached_func(*args, **kwargs))
+
+        wrapper.cache_info = cached_func.cache_info
+        wrapper.cache_clear = cached_func.cache_clear
+        return wrapper
+
+    return decorator
+
+
 def array_to_str(node, attr):
     if not node.has_valid(attr):
         return None
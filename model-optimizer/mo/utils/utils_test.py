@@ -18,7 +18,7 @@ import unittest
 
 import numpy as np
 
-from mo.utils.utils import match_shapes
+from mo.utils.utils import match_shapes, lru_cache_copy
 
 
 class TestMatchShapes(unittest.TestCase):
@@ -40,3 +40,19 @@ class TestMatchShapes(unittest.TestCase):
         self.assertFalse(self.run_match_shapes([-1,2,3], [1,3,3]))
         self.assertFalse(self.run_match_shapes([1,-1,3], [2,2]))
         self.assertFalse(self.run_match_shapes([-1, -1, -1], [2, 3, 4, 5]))
+
+
+class TestLruCacheCopy(unittest.TestCase):
+    def test_result_is_cached_and_copied(self):
+        calls = []
+
+        @lru_cache_copy(maxsize=4)
+        def parse(value: str):
+            calls.append(value)
+            return {'shape': np.array([int(x) for x in value.split(',')])}
+
+        first = parse('1,3,224,224')
+        first['shape'][0] = 8
+        second = parse('1,3,224,224')
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(np.array_equal(second['shape'], np.array([1, 3, 224, 224])))
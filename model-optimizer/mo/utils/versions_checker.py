@@ -15,10 +15,13 @@
 """
 
 
+import hashlib
+import json
 import logging as log
 import os
 import re
 import sys
+import time
 from distutils.version import LooseVersion
 
 modules = {
@@ -27,6 +30,9 @@ modules = {
 }
 critical_modules = ["networkx"]
 
+requirements_cache_dir = os.path.join(os.path.expanduser('~'), '.cache', 'openvino', 'mo')
+requirements_cache_lifetime = 7 * 24 * 60 * 60  # seconds
+
 message = "\nDetected not satisfied dependencies:\n" \
           "{}\n" \
           "Please install required versions of components or use install_prerequisites script\n" \
@@ -146,7 +152,67 @@ def version_check(name, installed_v, required_v, sign, not_satisfied_v, exit_cod
     return exit_code
 
 
-def check_requirements(framework=None):
+def get_requirements_cache_key(requirements_file):
+    """
+    Please do not add parameter type annotations (param:type).
+    Because we import this file while checking Python version.
+    Python 2.x will fail with no clear message on type annotations.
+
+    Computes a key describing the requirements file and the Python environment. The key changes if the requirements
+    file is modified, another interpreter is used or a package is installed/removed from the module search paths.
+    :param requirements_file: path to the requirements file
+    :return: hex digest string
+    """
+    key = hashlib.sha1()
+    with open(requirements_file, 'rb') as f:
+        key.update(f.read())
+    for path in [sys.executable] + sys.path:
+        if path and os.path.exists(path):
+            key.update('{}:{}'.format(path, os.path.getmtime(path)).encode())
+    return key.hexdigest()
+
+
+def is_requirements_check_cached(cache_file, key):
+    """
+    Please do not add parameter type annotations (param:type).
+    Because we import this file while checking Python version.
+    Python 2.x will fail with no clear message on type annotations.
+
+    Checks if a successful requirements check was saved for the same environment and is not outdated
+    :param cache_file: path to the cache file
+    :param key: key of the current environment
+    :return: True if the check can be skipped, False otherwise
+    """
+    try:
+        with open(cache_file) as f:
+            cached = json.load(f)
+        return cached['key'] == key and cached['ret'] == 0 and \
+            time.time() - cached['time'] < requirements_cache_lifetime
+    except (OSError, ValueError, KeyError, TypeError):
+        return False
+
+
+def save_requirements_check(cache_file, key, exit_code):
+    """
+    Please do not add parameter type annotations (param:type).
+    Because we import this file while checking Python version.
+    Python 2.x will fail with no clear message on type annotations.
+
+    Saves the result of the requirements check. Failures to write the cache are ignored.
+    :param cache_file: path to the cache file
+    :param key: key of the current environment
+    :param exit_code: exit code of the requirements check
+    """
+    try:
+        if not os.path.isdir(os.path.dirname(cache_file)):
+            os.makedirs(os.path.dirname(cache_file))
+        with open(cache_file, 'w') as f:
+            json.dump({'key': key, 'ret': exit_code, 'time': time.time()}, f)
+    except OSError as e:
+        log.debug('Failed to save the requirements check result to {}: {}'.format(cache_file, e))
+
+
+def check_requirements(framework=None, use_cache=False):
     """
     Please do not add parameter type annotations (param:type).
     Because we import this file while checking Python version.
@@ -156,6 +222,7 @@ def check_requirements(framework=None):
     Logs a warning in case of permissible dissatisfaction
     Logs an error in cases of critical dissatisfaction
     :param framework: framework name
+    :param use_cache: skip the check if it was passed for the same environment before and save the successful result
     :return: exit code (0 - execution successful, 1 - error)
     """
     if framework is None:
@@ -164,6 +231,13 @@ def check_requirements(framework=None):
         framework_suffix = "_{}".format(framework)
     file_name = "requirements{}.txt".format(framework_suffix)
     requirements_file = os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, file_name))
+
+    if use_cache:
+        cache_file = os.path.join(requirements_cache_dir, 'reqcheck-{}.json'.format(framework or 'all'))
+        cache_key = get_requirements_cache_key(requirements_file)
+        if is_requirements_check_cached(cache_file, cache_key):
+            return 0
+
     requirements_list = get_module_version_list_from_file(requirements_file)
     not_satisfied_versions = []
     exit_code = 0
@@ -200,4 +274,7 @@ def check_requirements(framework=None):
             log.error(message.format(missed_modules_message, helper_command))
         else:
             log.error(message.format(missed_modules_message, helper_command), extra={'is_warning': True})
+    elif use_cache:
+        # only a fully satisfied check is saved to not hide the warnings on the next runs
+        save_requirements_check(cache_file, cache_key, exit_code)
     return exit_code
@@ -14,11 +14,14 @@
  limitations under the License.
 """
 
+import os
+import tempfile
 import unittest
 import unittest.mock as mock
 from unittest.mock import mock_open
 
-from mo.utils.versions_checker import get_module_version_list_from_file, parse_versions_list
+from mo.utils.versions_checker import get_module_version_list_from_file, parse_versions_list, \
+    is_requirements_check_cached, save_requirements_check
 
 
 class TestingVersionsChecker(unittest.TestCase):
@@ -54,3 +57,18 @@ class TestingVersionsChecker(unittest.TestCase):
                     ('mxnet', '<=', '1.3.1')]
         for i, v in enumerate(req_list):
             self.assertEqual(v, ref_list[i])
+
+    def test_requirements_check_cache(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache_file = os.path.join(tmp_dir, 'cache', 'reqcheck-tf.json')
+            self.assertFalse(is_requirements_check_cached(cache_file, 'key'))
+            save_requirements_check(cache_file, 'key', 0)
+            self.assertTrue(is_requirements_check_cached(cache_file, 'key'))
+            self.assertFalse(is_requirements_check_cached(cache_file, 'other_key'))
+
+    @mock.patch('mo.utils.versions_checker.requirements_cache_lifetime', -1)
+    def test_requirements_check_cache_outdated(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache_file = os.path.join(tmp_dir, 'reqcheck-tf.json')
+            save_requirements_check(cache_file, 'key', 0)
+            self.assertFalse(is_requirements_check_cached(cache_file, 'key'))